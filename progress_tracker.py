@@ -29,15 +29,38 @@
 ###################### Imports ######################
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from datetime import date
+from datetime import date, datetime
 import json
 import os
+import re
+
+# orjson is optional, it's a lot faster than json but stdlib works fine
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # compact utf-8 output, same shape as what orjson writes
+    _dumps = lambda data: json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+    _loads = json.loads
 
 ###################### Textbook Class & Data Handling ######################
 textbooks_file = "textbooks.json" # persistent textbook data storage
 
+def chapter_sort_key(chap):
+    # numbered chapters in numeric order, then anything else ("A", "II", "1.5") by name
+    try:
+        return (0, int(chap), "")
+    except ValueError:
+        return (1, 0, chap)
+
 class Textbook:
     # Ccass to represent a textbook and its progress tracking data
+    # slots instead of a per-instance __dict__, keeps textbooks small and attribute access fast
+    __slots__ = ('name', 'author', 'total_pages', 'current_page', 'problems_dict', 'chapters',
+                 'start_date', 'end_date', 'completed_problems', '_dirty', '_cached_dict',
+                 '_start_ord', '_end_ord', '_pct_per_day', '_pct_per_page')
+
     def __init__(self, name, author, total_pages, problems_dict, start_date, end_date, current_page=0):  # Modified
         # initialize textbook properties
         self.name = name
@@ -45,13 +68,26 @@ class Textbook:
         self.total_pages = total_pages
         self.current_page = current_page
         self.problems_dict = problems_dict
+        # read-only (chapter, problems) pairs in chapter order, built once and reused by update_tree
+        self.chapters = tuple((c, tuple(problems_dict[c])) for c in sorted(problems_dict, key=chapter_sort_key))
         self.start_date = start_date
         self.end_date = end_date
-        self.completed_problems = {}
+        # dates and page count never change after creation, so the progress math is set up once
+        self._start_ord = start_date.toordinal()
+        self._end_ord = end_date.toordinal()
+        total_days = self._end_ord - self._start_ord
+        self._pct_per_day = 100.0 / total_days if total_days else 0.0
+        self._pct_per_page = 100.0 / total_pages if total_pages else 0.0
+        self.completed_problems = set()
+        self._dirty = True # set whenever the data changes so to_dict rebuilds
+        self._cached_dict = None
 
     def to_dict(self):
         # converts textbook to dictionary for json file
-        return {
+        # unchanged textbooks reuse the dictionary from the last save
+        if not self._dirty and self._cached_dict:
+            return self._cached_dict
+        self._cached_dict = {
             "name": self.name,
             "author": self.author,
             "total_pages": self.total_pages,
@@ -59,13 +95,31 @@ class Textbook:
             "problems_dict": self.problems_dict,
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat(),
-            "completed_problems": self.completed_problems
+            "completed_problems": sorted(self.completed_problems)
         }
+        self._dirty = False
+        return self._cached_dict
+
+    # mutators, these flag the textbook so the next save rebuilds its dictionary
+    def set_page(self, page):
+        self.current_page = page
+        self._dirty = True
+
+    def mark_complete(self, prob, complete=True):
+        # returns whether the problem's status actually changed
+        if (prob in self.completed_problems) == complete:
+            return False
+        if complete:
+            self.completed_problems.add(prob)
+        else:
+            self.completed_problems.discard(prob)
+        self._dirty = True
+        return True
 
     @classmethod
     def from_dict(cls, data):
         # creates textbook from dictionary
-        return cls(
+        textbook = cls(
             data["name"],
             data["author"],
             data["total_pages"],
@@ -74,23 +128,117 @@ class Textbook:
             date.fromisoformat(data["end_date"]),
             data["current_page"]
         )
+        # older files store {problem: {"complete": True}}, iterating either gives the problem ids
+        # ids that aren't problems of this textbook anymore get dropped
+        known = {p for probs in textbook.problems_dict.values() for p in probs}
+        textbook.completed_problems = known.intersection(data.get("completed_problems", ()))
+        return textbook
 
 def load_textbooks():
-    # loads textbooks from textbooks.json
-    if os.path.exists(textbooks_file):
-        with open(textbooks_file, "r") as f:
-            return [Textbook.from_dict(td) for td in json.load(f)]
-    return [] # returns empty list if the file doesn't exist
-              # file gets created, but not in this line
+    # loads textbooks.json, returns an iterator over the raw textbook records
+    # _load_chunk turns them into Textbooks a few at a time
+    try:
+        with open(textbooks_file, "rb") as f:
+            return iter(_loads(f.read()))
+    except FileNotFoundError:
+        return iter(()) # returns empty iterator if the file doesn't exist
+                        # file gets created, but not in this line
+
+# incremental loading, textbooks get added to the sidebar a chunk at a time
+_load_pending = None # iterator of records not loaded yet, None once done
+_load_errors = [] # problems with records that couldn't be loaded
+_failed_records = [] # those records as read, written back untouched on every save
+_END = object() # marks the end of the records, a null record in the file must not look like it
+
+def _load_chunk():
+    global _load_pending
+    it = _load_pending
+    if it is None:
+        return
+    for _ in range(16):
+        data = next(it, _END)
+        if data is _END:
+            _load_pending = None
+            if _load_errors:
+                messagebox.showerror(
+                    "Error",
+                    f"Couldn't load {len(_load_errors)} textbook(s) from {textbooks_file}:\n"
+                    + "\n".join(_load_errors)
+                    + "\n\nThey're kept in the file unchanged, everything else saves as usual."
+                )
+            return
+        try:
+            textbook = Textbook.from_dict(data)
+        except Exception as e:
+            # skip the record but hold on to it so saving doesn't drop it from the file
+            name = data.get("name", "?") if isinstance(data, dict) else "?"
+            _load_errors.append(f"{name}: {e!r}")
+            _failed_records.append(data)
+            continue
+        append_textbook(textbook)
+        if len(textbooks) == 1:
+            textbooks_list.selection_set(0)
+            on_select(None) # initial display
+    root.after_idle(_load_chunk)
+
+def finish_loading():
+    # loads whatever is left right away, so a save never drops unloaded textbooks
+    while _load_pending is not None:
+        _load_chunk()
+
+_last_saved = None # bytes of the last successful save
 
 def save_textbooks(textbooks):
+    global _last_saved
     # saves all textbooks to json file
-    with open(textbooks_file, "w") as f:
-        json.dump([t.to_dict() for t in textbooks], f)
+    # written to a temp file first and swapped in, so a crash can't corrupt it
+    # records that failed to load go back out as they came in
+    buf = _dumps([t.to_dict() for t in textbooks] + _failed_records)
+    if buf == _last_saved:
+        return # nothing changed since the last save
+    tmp = textbooks_file + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, textbooks_file)
+    _last_saved = buf
+
+# debounced saving, rapid edits get coalesced into a single write
+_save_pending = None # pending root.after handle, None if nothing is queued
+
+def schedule_save():
+    # queue a save if one isn't already waiting
+    global _save_pending
+    if _save_pending is None:
+        _save_pending = root.after(500, _do_save)
+
+def _do_save():
+    global _save_pending
+    _save_pending = None
+    finish_loading()
+    save_textbooks(textbooks)
+
+def flush_save():
+    # write out a queued save right away
+    if _save_pending is not None:
+        root.after_cancel(_save_pending)
+        _do_save()
+
+def on_close():
+    flush_save() # don't lose edits made in the last 500ms
+    root.destroy()
 
 ###################### Core Functionality ######################
 
 
+# (entry key, label) for each input row in the add textbook window
+DIALOG_FIELDS = [
+    ('name', 'Name:'),
+    ('author', 'Author:'),
+    ('pages', 'Total Pages:'),
+    ('start', 'Start Date (YYYY-MM-DD):'),
+    ('end', 'End Date (YYYY-MM-DD):'),
+]
+
 # window for adding new textbooks
 def add_textbook_dialog():
     dialog = tk.Toplevel()
@@ -98,25 +246,11 @@ def add_textbook_dialog():
     entries = {}
     
     # input fields for name, author, pages, etc
-    ttk.Label(dialog, text="Name:").grid(row=0, column=0)
-    entries['name'] = ttk.Entry(dialog)
-    entries['name'].grid(row=0, column=1)
-    
-    ttk.Label(dialog, text="Author:").grid(row=1, column=0)
-    entries['author'] = ttk.Entry(dialog)
-    entries['author'].grid(row=1, column=1)
-    
-    ttk.Label(dialog, text="Total Pages:").grid(row=2, column=0)
-    entries['pages'] = ttk.Entry(dialog)
-    entries['pages'].grid(row=2, column=1)
-    
-    ttk.Label(dialog, text="Start Date (YYYY-MM-DD):").grid(row=3, column=0)
-    entries['start'] = ttk.Entry(dialog)
-    entries['start'].grid(row=3, column=1)
-    
-    ttk.Label(dialog, text="End Date (YYYY-MM-DD):").grid(row=4, column=0)
-    entries['end'] = ttk.Entry(dialog)
-    entries['end'].grid(row=4, column=1)
+    for row, (key, label) in enumerate(DIALOG_FIELDS):
+        ttk.Label(dialog, text=label).grid(row=row, column=0, sticky='w')
+        entries[key] = entry = ttk.Entry(dialog)
+        entry.grid(row=row, column=1, sticky='ew')
+    dialog.columnconfigure(1, weight=1)
     
 
 # form submission and validation, e.g. page numbers have to be int, dates have to be dates
@@ -141,19 +275,19 @@ def add_textbook_dialog():
             )
 
             # updates the textbook
-            textbooks.append(new_textbook)
-            save_textbooks(textbooks)
-            textbooks_list.insert(tk.END, new_textbook.name)
+            append_textbook(new_textbook)
+            schedule_save()
             dialog.destroy()
         except Exception as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
     
 
-    # chapter problem section
-    ttk.Label(dialog, text="Chapters/Problems:").grid(row=5, column=0, columnspan=2)
+    # chapter problem section, placed below however many field rows there are
+    row = len(DIALOG_FIELDS)
+    ttk.Label(dialog, text="Chapters/Problems:").grid(row=row, column=0, columnspan=2)
     
     entries['problems'] = tk.Text(dialog, height=15, width=50, wrap=tk.NONE)
-    entries['problems'].grid(row=6, column=0, columnspan=2, sticky='ew')
+    entries['problems'].grid(row=row + 1, column=0, columnspan=2, sticky='ew')
     
     # Formatting example for how to type in problems
     example = ttk.Label(
@@ -166,123 +300,209 @@ def add_textbook_dialog():
         foreground="#666666",
         font=("Spectral", 9)
     )
-    example.grid(row=7, column=0, columnspan=2, sticky="w")
+    example.grid(row=row + 2, column=0, columnspan=2, sticky="w")
 
     # submit new textbook! 
-    ttk.Button(dialog, text="Add", command=parse_and_add).grid(row=8, column=0, columnspan=2)
+    ttk.Button(dialog, text="Add", command=parse_and_add).grid(row=row + 3, column=0, columnspan=2)
+
 
+# matches either a "Chapter i" header (group 1) or any other non-empty line (group 2)
+_CHAP_RE = re.compile(r'^[ \t]*chapter[ \t]+(\S+).*$|^(.+)$', re.IGNORECASE | re.MULTILINE)
 
 # converts csv text input 1.1, 1.2, 1.3, etc to a problem dictionary
 def parse_problems(text):
     problems = {}
     current_chapter = None
-    for line in text.strip().split('\n'):
-        line = line.strip()
+    for match in _CHAP_RE.finditer(text):
+        chapter, line = match.groups()
         # seperating Chapter i
-        if line.lower().startswith("chapter "):
-            current_chapter = line.split()[1]
+        if chapter:
+            current_chapter = chapter
             problems[current_chapter] = []
-        # add problem to chapter    
-        elif current_chapter and line:
-            problems[current_chapter].extend([p.strip() for p in line.split(',')])
+        # add problem to chapter
+        elif current_chapter:
+            # map(str.strip) keeps the stripping in C, inner spaces ("3.2 (a)") are left alone
+            problems[current_chapter].extend(p for p in map(str.strip, line.split(',')) if p)
     return problems
 
 # update progress indicators
 def update_display():
-    if not current_textbook:
+    global _last_semester_text, _last_textbook_text
+    tb = current_textbook
+    if not tb:
         return
     
-    # calculate date related stuff
-    today = date.today()
-    start = current_textbook.start_date
-    end = current_textbook.end_date
-    total_days = (end - start).days
-    days_elapsed = max(0, (today - start).days) if start <= today else 0
-    days_left = max(0, (end - today).days) if today <= end else 0
+    # bind the textbook fields used below to locals once
+    total = tb.total_pages
+    cur = tb.current_page
+    
+    # calculate date related stuff, ordinals are plain ints so no timedeltas get built
+    today_ord = date.today().toordinal()
+    start_ord = tb._start_ord
+    end_ord = tb._end_ord
+    total_days = end_ord - start_ord
+    days_elapsed = max(0, today_ord - start_ord) if start_ord <= today_ord else 0
+    days_left = max(0, end_ord - today_ord) if today_ord <= end_ord else 0
     
-    # update progress bars
-    semester_progress['value'] = (days_elapsed / total_days * 100) if total_days else 0
-    textbook_progress['value'] = (current_textbook.current_page / current_textbook.total_pages * 100) if current_textbook.total_pages else 0
+    # calculate progress percentages, multiplies by the precomputed per-day/per-page share
+    semester_pct = days_elapsed * tb._pct_per_day
+    textbook_pct = cur * tb._pct_per_page
     
-    # update labels
-    title_label.config(text=f"{current_textbook.name} by {current_textbook.author}")
-    semester_label.config(text=f"Timeframe: {days_elapsed}/{total_days} days ({semester_progress['value']:.1f}%)")
-    textbook_label.config(text=f"Pages: {current_textbook.current_page}/{current_textbook.total_pages} ({textbook_progress['value']:.1f}%)")
+    # update labels and progress bars
+    # the label text includes the rounded percentage, so an unchanged label means
+    # the bar doesn't need touching either
+    title_label.config(text=f"{tb.name} by {tb.author}")
+    semester_text = f"Timeframe: {days_elapsed}/{total_days} days ({semester_pct:.1f}%)"
+    if semester_text != _last_semester_text:
+        semester_progress['value'] = semester_pct
+        semester_label.config(text=semester_text)
+        _last_semester_text = semester_text
+    textbook_text = f"Pages: {cur}/{total} ({textbook_pct:.1f}%)"
+    if textbook_text != _last_textbook_text:
+        textbook_progress['value'] = textbook_pct
+        textbook_label.config(text=textbook_text)
+        _last_textbook_text = textbook_text
     
     # calculate reading pace
     if days_left > 0:
-        pages_needed = current_textbook.total_pages - current_textbook.current_page
-        pages_per_day_label.config(text=f"Required pace: {pages_needed / days_left:.2f} pages/day")
+        pages_per_day_label.config(text=f"Required pace: {(total - cur) / days_left:.2f} pages/day")
     else:
         pages_per_day_label.config(text="")
-    
-    update_tree() # refresh
+
+# the timeframe only moves once a day, so refresh at midnight instead of polling
+def schedule_midnight_refresh():
+    now = datetime.now()
+    ms_until_midnight = ((24*3600) - (now.hour*3600 + now.minute*60 + now.second)) * 1000
+    root.after(ms_until_midnight, _midnight_refresh)
+
+def _midnight_refresh():
+    update_display()
+    # recomputed from the clock each time rather than +24h, so errors don't accumulate
+    # the delay assumes a 24 hour day though, so on DST change days it fires an hour
+    # early or late and the following run lines back up with midnight
+    schedule_midnight_refresh()
 
 def update_tree():
     tree.delete(*tree.get_children()) # clear existing items
+    _lazy_chapters.clear()
+    _problem_rows.clear()
     if not current_textbook:
         return
     
-    # sort chapters
-    for chap in sorted(current_textbook.problems_dict, key=lambda x: int(x)):
+    insert = tree.insert
+    # chapters are inserted back to front at index 0 so each insert
+    # pushes its siblings down instead of appending to the end
+    for chap, probs in reversed(current_textbook.chapters):
         # create parent item for chapter
-        parent = tree.insert("", tk.END, text=f"Chapter {chap}", open=False)
-        # create child item for problems
-        for prob in current_textbook.problems_dict[chap]:
-            status = " ✓" if prob in current_textbook.completed_problems else ""
-            tree.insert(parent, tk.END, text=f"{prob}{status}", values=(prob,))
+        parent = insert("", 0, text=f"Chapter {chap}", open=False)
+        # problems are only inserted once the chapter is opened, see on_chapter_open
+        # a placeholder child keeps the expand arrow showing until then
+        if probs:
+            insert(parent, 0, text="…")
+            _lazy_chapters[parent] = probs
+
+# chapter item -> that chapter's problems, for chapters whose problems haven't been inserted yet
+_lazy_chapters = {}
+# problem id -> every inserted row showing it, ids can repeat across chapters
+# and completion is stored per id, so all of them change together
+_problem_rows = {}
+
+def on_chapter_open(event):
+    # fills in a chapter's problems the first time it's expanded
+    parent = tree.focus()
+    probs = _lazy_chapters.pop(parent, None)
+    if probs is None or not current_textbook:
+        return
+    tree.delete(*tree.get_children(parent)) # drop the placeholder
+    
+    # bind everything the inner loop touches to locals
+    completed = current_textbook.completed_problems
+    insert = tree.insert
+    # create child item for problems
+    for prob in reversed(probs):
+        if prob in completed:
+            item = insert(parent, 0, text=prob, values=("✓", prob), tags=("done",))
+        else:
+            item = insert(parent, 0, text=prob, values=("", prob))
+        _problem_rows.setdefault(prob, []).append(item)
 
 # problem completion status
 def mark_problem(complete=True):
     if not current_textbook:
         return
     
+    changed = False
+    
     # process selected item
     for item in tree.selection():
         if tree.parent(item): # don't process chapters
             # update this in the future, add a way to process chapters
-            prob = tree.item(item, "values")[0]
-            if complete:
-                current_textbook.completed_problems[prob] = {"complete": True}
-            else:
-                current_textbook.completed_problems.pop(prob, None)
+            prob = tree.set(item, "problem")
+            if current_textbook.mark_complete(prob, complete):
+                changed = True
+            # the ✓ cell and the "done" tag's colour change in a single call
+            # every row for this id is refreshed, even if the set didn't change,
+            # so none of them can show a stale state
+            for row in _problem_rows.get(prob, (item,)):
+                if complete:
+                    tree.item(row, values=("✓", prob), tags=("done",))
+                else:
+                    tree.item(row, values=("", prob), tags=())
     
-    save_textbooks(textbooks) # persistence
-    update_tree() # refresh
+    if changed:
+        schedule_save() # persistence, one save for the whole selection
+    # only the toggled problems' rows change, no full update_tree() rebuild
 
 # update page number
 def update_page():
-    if current_textbook and page_entry.get().isdigit():
-        try:
-            new_page = int(page_entry.get())
-            if 0 <= new_page <= current_textbook.total_pages:
-                current_textbook.current_page = new_page
-                save_textbooks(textbooks)  # explicit save after update
-                update_display() #refresh
-        except ValueError:
-            pass # ignore non integer values
+    page = page_entry.get()
+    if not current_textbook or not page:
+        return
+    new_page = int(page) # page_entry only accepts digits, see page_vcmd
+    if new_page <= current_textbook.total_pages:
+        current_textbook.set_page(new_page)
+        schedule_save()  # explicit save after update
+        update_display() #refresh
+
+
+# sidebar bookkeeping
+# textbooks and textbooks_list share indices, these keep the two in step so
+# selections resolve straight to Textbook objects without asking Tk for names
+def append_textbook(textbook):
+    textbooks.append(textbook)
+    textbooks_list.insert(tk.END, textbook.name)
 
+def remove_textbook(index):
+    textbooks.pop(index)
+    textbooks_list.delete(index)
+
+def selected_textbook():
+    # returns (index, textbook) for the sidebar selection, or (None, None)
+    selection = textbooks_list.curselection()
+    if not selection:
+        return None, None
+    return selection[0], textbooks[selection[0]]
 
 # textbook selection
 def on_select(event):
     global current_textbook
-    selection = textbooks_list.curselection()
-    if selection:
-        current_textbook = textbooks[selection[0]]
+    index, textbook = selected_textbook()
+    if textbook:
+        current_textbook = textbook
         page_entry.delete(0, tk.END)
         page_entry.insert(0, str(current_textbook.current_page))
         update_display()
+        update_tree() # the tree only needs rebuilding when the textbook changes
 
 
 
 def delete_textbook():
-    selection = textbooks_list.curselection()
-    if not selection:
+    index, textbook = selected_textbook()
+    if not textbook:
         messagebox.showinfo("Error", "No textbook selected")
         return
     
-    index = selection[0]
-    textbook_name = textbooks_list.get(index)
+    textbook_name = textbook.name
     
     # confirmation dialog
     confirm = messagebox.askyesno(
@@ -293,13 +513,12 @@ def delete_textbook():
         return
     
     # remove from list and update UI
-    textbooks.pop(index)
-    textbooks_list.delete(index)
-    save_textbooks(textbooks)
+    remove_textbook(index)
+    schedule_save()
     
     # clear display if deleted textbook was selected
     global current_textbook
-    if current_textbook and current_textbook.name == textbook_name:
+    if current_textbook is textbook:
         current_textbook = None
         clear_display()
     
@@ -311,6 +530,8 @@ def delete_textbook():
 
 # clear all progress indicators
 def clear_display():
+    global _last_semester_text, _last_textbook_text
+    _last_semester_text = _last_textbook_text = ""
     
     title_label.config(text="")
     semester_label.config(text="")
@@ -319,6 +540,8 @@ def clear_display():
     semester_progress['value'] = 0
     textbook_progress['value'] = 0
     tree.delete(*tree.get_children())
+    _lazy_chapters.clear()
+    _problem_rows.clear()
     page_entry.delete(0, tk.END)
 
 
@@ -355,6 +578,10 @@ main_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 # nitialize current textbook
 current_textbook = None
 
+# last text shown on the progress labels, lets update_display skip unchanged ones
+_last_semester_text = ""
+_last_textbook_text = ""
+
 ###################### Progress Section ######################
 progress_frame = ttk.Frame(main_frame, padding=10)
 progress_frame.pack(fill=tk.X)
@@ -384,9 +611,11 @@ pages_per_day_label.pack(anchor="w")
 entry_frame = ttk.Frame(progress_frame)
 entry_frame.pack(pady=10)
 ttk.Label(entry_frame, text="Current Page:").pack(side=tk.LEFT)
-page_entry = ttk.Entry(entry_frame, width=8)
+# only lets digits be typed, so update_page never has to handle a bad int()
+page_vcmd = (root.register(lambda P: P == "" or (P.isdecimal() and len(P) <= 5)), "%P")
+page_entry = ttk.Entry(entry_frame, width=8, validate="key", validatecommand=page_vcmd)
 page_entry.pack(side=tk.LEFT, padx=5)
-update_btn = ttk.Button(entry_frame, text="Update", command=lambda: [update_page(), update_display()])
+update_btn = ttk.Button(entry_frame, text="Update", command=update_page)
 update_btn.pack(side=tk.LEFT)
 
 ###################### Problem Tracker ######################
@@ -394,8 +623,13 @@ problems_frame = ttk.LabelFrame(main_frame, text="Problems", padding=10)
 problems_frame.pack(fill=tk.BOTH, expand=True)
 
 # treeview widget
-tree = ttk.Treeview(problems_frame, show="tree")
+# completion is a ✓ in the "done" column so toggling only touches that cell
+# and never re-measures the label, the hidden "problem" column holds the raw problem id
+tree = ttk.Treeview(problems_frame, columns=("done", "problem"), displaycolumns=("done",), show="tree")
+tree.column("done", width=30, stretch=False, anchor="center")
+tree.tag_configure("done", foreground="#2a2") # completed problems, styled once here
 tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+tree.bind("<<TreeviewOpen>>", on_chapter_open)
 
 
 # problem action buttons
@@ -408,15 +642,19 @@ ttk.Button(button_frame, text="Mark Problem Incomplete", command=lambda: mark_pr
 
 ###################### Initialization ######################
 
-textbooks = load_textbooks()
-for textbook in textbooks:
-    textbooks_list.insert(tk.END, textbook.name)
-
 # textbook selection
 textbooks_list.bind("<<ListboxSelect>>", on_select)
-if textbooks:
-    textbooks_list.selection_set(0)
-    on_select(None) # initial display
+
+# textbooks are filled in by _load_chunk once the window is up
+textbooks = []
+_load_pending = load_textbooks()
+root.after_idle(_load_chunk)
+
+# keep the timeframe progress current if the app stays open past midnight
+schedule_midnight_refresh()
+
+# flush pending saves on exit
+root.protocol("WM_DELETE_WINDOW", on_close)
 
 # runs the program
 root.mainloop()